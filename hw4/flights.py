@@ -3,6 +3,9 @@ Module providing an Airport and Flight classes, as well as some
 supporting data types. This module also includes functions to
 create sample schedules described in the homework writeup.
 """
+import csv
+import random
+from collections.abc import ValuesView
 from enum import IntEnum
 
 
@@ -22,9 +25,12 @@ class Airport:
     Class representing an individual airport
     """
 
+    __slots__ = ("__name", "__code", "__flights", "__departures")
+
     __name: str
     __code: str
     __flights: dict[str, "Flight"]
+    __departures: list[list["Flight"]]
 
     def __init__(self, name: str, code: str):
         """
@@ -41,6 +47,7 @@ class Airport:
         self.__code = code
 
         self.__flights = {}
+        self.__departures = [[] for _ in TimeOfDay]
 
     def __str__(self) -> str:
         """
@@ -84,6 +91,25 @@ class Airport:
         """
         return set(self.__flights.values())
 
+    @property
+    def flights_view(self) -> ValuesView["Flight"]:
+        """
+        Returns: Read-only view of the flights departing from this
+        airport. Unlike the flights property, this does not make a
+        copy, so it reflects any flights added afterwards.
+        """
+        return self.__flights.values()
+
+    def flights_at(self, time: TimeOfDay) -> list["Flight"]:
+        """
+        Args:
+            time: Time of day
+
+        Returns: Flights departing from this airport at the given
+        time of day (and only at that time of day)
+        """
+        return list(self.__departures[time])
+
     def add_flight(self, flight: "Flight") -> None:
         """
         Adds a flight to the set of flights departing
@@ -99,7 +125,34 @@ class Airport:
                     f"Origin airport ({flight.origin.code}) does not match."
         assert flight.origin == self, error_msg
 
+        if flight.code in self.__flights:
+            old = self.__flights[flight.code]
+            self.__departures[old.departure_time].remove(old)
+
         self.__flights[flight.code] = flight
+        self.__departures[flight.departure_time].append(flight)
+
+    def remove_flight(self, code: str) -> "Flight":
+        """
+        Removes a flight from the set of flights departing
+        from this airport.
+
+        Args:
+            code: Flight code (two letters followed by four digits,
+            e.g., UC0001)
+
+        Raises:
+            ValueError: If no flight with that code departs from
+            the airport
+
+        Returns: The Flight object that was removed
+        """
+        flight = self.get_flight_by_code(code)
+
+        del self.__flights[code]
+        self.__departures[flight.departure_time].remove(flight)
+
+        return flight
 
     def get_flight_by_code(self, code: str) -> "Flight":
         """
@@ -130,10 +183,14 @@ class Flight:
     Class representing an individual flight.
     """
 
+    __slots__ = ("__origin", "__destination", "__airline", "__flight_num",
+                 "__code", "__departure_time", "__cost")
+
     __origin: Airport
     __destination: Airport
     __airline: str
     __flight_num: int
+    __code: str
     __departure_time: TimeOfDay
     __cost: int
 
@@ -159,6 +216,7 @@ class Flight:
         self.__destination = destination
         self.__airline = airline
         self.__flight_num = flight_num
+        self.__code = f"{airline}{flight_num:04}"
         self.__departure_time = departure_time
         self.__cost = cost
 
@@ -166,7 +224,7 @@ class Flight:
         """
         Returns: String representation of flight
         """
-        return f"{self.code}: {self.__origin.code} -> " \
+        return f"{self.__code}: {self.__origin.code} -> " \
                f"{self.__destination.code} @ {self.__departure_time.name}"
 
     def __repr__(self) -> str:
@@ -180,7 +238,7 @@ class Flight:
         If we need to sort flights at any point, we will
         do so by the flight code.
         """
-        return self.code < other.code
+        return self.__code < other.code
 
     @property
     def origin(self) -> Airport:
@@ -217,7 +275,7 @@ class Flight:
         by the flight number (if the flight number has less than 4 digits,
         it is padded with zeros on the left)
         """
-        return f"{self.__airline}{self.__flight_num:04}"
+        return self.__code
 
     @property
     def departure_time(self) -> TimeOfDay:
@@ -401,3 +459,89 @@ def sample_schedule_4() -> dict[str, Airport]:
     sfo = Airport("San Francisco International", "SFO")
 
     return {"ORD": ord, "LGA": lga, "LAX": lax, "SFO": sfo}
+
+def _airport_code(i: int) -> str:
+    """
+    Returns: The i-th generated airport code (AAA, AAB, ..., ZZZ)
+    """
+    return chr(ord("A") + i // 676) + chr(ord("A") + i // 26 % 26) \
+        + chr(ord("A") + i % 26)
+
+def _flight_id(i: int) -> tuple[str, int]:
+    """
+    Returns: The airline code and flight number of the i-th generated
+    flight. Flight numbers go up to 9999, after which we move on to the
+    next airline code (AA, AB, ..., ZZ)
+    """
+    n = i // 9999
+    return chr(ord("A") + n // 26) + chr(ord("A") + n % 26), i % 9999 + 1
+
+def generated_schedule(num_airports: int, flights_per_airport: int,
+                       min_cost: int = 50, max_cost: int = 1000,
+                       seed: int = 0) -> dict[str, Airport]:
+    """
+    Generates a hub-and-spoke schedule. Roughly one in ten airports is a
+    hub; flights leaving a hub can go to any other airport, while flights
+    leaving any other airport only go to hubs. The same arguments always
+    produce the same schedule.
+
+    Args:
+        num_airports: Number of airports (at least 2)
+        flights_per_airport: Number of flights departing from each airport
+        min_cost, max_cost: Range of flight costs (inclusive)
+        seed: Seed for the random number generator
+
+    Returns: A schedule with generated airport codes (AAA, AAB, ...)
+    """
+    assert 2 <= num_airports <= 26 ** 3, "Invalid number of airports"
+    assert num_airports * flights_per_airport <= 676 * 9999, \
+        "Too many flights"
+    assert 0 < min_cost <= max_cost, "Invalid cost range"
+
+    rng = random.Random(seed)
+
+    codes = [_airport_code(i) for i in range(num_airports)]
+    airports = {code: Airport(f"{code} International", code)
+                for code in codes}
+
+    hubs = codes[:max(1, num_airports // 10)]
+    hub_set = set(hubs)
+    times = list(TimeOfDay)
+
+    num_flights = 0
+    for code in codes:
+        destinations = codes if code in hub_set else hubs
+        for _ in range(flights_per_airport):
+            dest_code = rng.choice(destinations)
+            while dest_code == code:
+                dest_code = rng.choice(codes)
+
+            airports[code].add_flight(
+                Flight(airports[code], airports[dest_code],
+                       *_flight_id(num_flights), rng.choice(times),
+                       rng.randint(min_cost, max_cost)))
+            num_flights += 1
+
+    return airports
+
+def write_schedule(airports: dict[str, Airport], file_path: str) -> None:
+    """
+    Writes a schedule to a CSV file, using the same format as the
+    files in the files/ directory.
+
+    Args:
+        airports: Schedule
+        file_path: Path to file
+    """
+    with open(file_path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(["airline", "flight_num", "origin_code",
+                         "origin_name", "destination_code",
+                         "destination_name", "departure_time", "cost"])
+        for airport in airports.values():
+            for flight in sorted(airport.flights):
+                writer.writerow([flight.airline, flight.flight_num,
+                                 flight.origin.code, flight.origin.name,
+                                 flight.destination.code,
+                                 flight.destination.name,
+                                 flight.departure_time.name, flight.cost])
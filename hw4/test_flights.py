@@ -0,0 +1,190 @@
+"""
+Tests for the support code in flights.py
+
+These are not part of the homework rubric, so pytest.ini excludes them
+from the default test run (see --ignore in addopts). Run them with:
+
+    py.test test_flights.py
+"""
+
+import csv
+import re
+from pathlib import Path
+
+import pytest
+
+from flights import (Flight, TimeOfDay, generated_schedule,
+                     sample_schedule_1, write_schedule)
+
+
+def read_rows(file_path: str) -> list[list[str]]:
+    """
+    Returns: The rows of a CSV file (including the header)
+    """
+    with open(file_path, newline="", encoding="utf-8") as f:
+        return list(csv.reader(f))
+
+
+def test_remove_flight() -> None:
+    """
+    A removed flight no longer appears in any of the airport's
+    views of its departures
+    """
+    airports = sample_schedule_1()
+    ord = airports["ORD"]  # pylint: disable=redefined-builtin
+
+    flight = ord.remove_flight("UC0001")
+
+    assert flight.code == "UC0001"
+    assert flight not in ord.flights
+    assert flight not in ord.flights_view
+    for time in TimeOfDay:
+        assert flight not in ord.flights_at(time)
+
+    with pytest.raises(ValueError):
+        ord.get_flight_by_code("UC0001")
+
+
+def test_remove_missing_flight() -> None:
+    """
+    Removing a flight that does not depart from the airport
+    raises a ValueError
+    """
+    airports = sample_schedule_1()
+
+    with pytest.raises(ValueError):
+        airports["ORD"].remove_flight("UC0003")
+
+    with pytest.raises(ValueError):
+        airports["ORD"].remove_flight("UC9999")
+
+
+def test_replace_flight_departure_time() -> None:
+    """
+    Adding a flight with the same code as an existing one, but a different
+    departure time, moves it to the new time of day
+    """
+    airports = sample_schedule_1()
+    ord = airports["ORD"]  # pylint: disable=redefined-builtin
+    lga = airports["LGA"]
+
+    old = ord.get_flight_by_code("UC0001")
+    new = Flight(ord, lga, "UC", 1, TimeOfDay.EVENING, 200)
+    ord.add_flight(new)
+
+    assert ord.get_flight_by_code("UC0001") is new
+    assert ord.flights == {new, ord.get_flight_by_code("UC0002")}
+    assert len(ord.flights_view) == 2
+    assert not ord.flights_at(TimeOfDay.MORNING)
+    assert ord.flights_at(TimeOfDay.EVENING) == [new]
+    for time in TimeOfDay:
+        assert old not in ord.flights_at(time)
+
+
+def test_flights_view() -> None:
+    """
+    flights_view reflects flights added after it was obtained, while
+    flights returns a separate set that can be modified without
+    affecting the airport
+    """
+    airports = sample_schedule_1()
+    ord = airports["ORD"]  # pylint: disable=redefined-builtin
+    lga = airports["LGA"]
+
+    view = ord.flights_view
+    flights = ord.flights
+    assert set(view) == flights
+
+    flight = Flight(ord, lga, "UC", 8, TimeOfDay.NIGHT, 100)
+    ord.add_flight(flight)
+
+    assert flight in view
+    assert len(view) == 3
+    assert flight not in flights
+
+    flights.clear()
+    assert len(ord.flights) == 3
+    assert ord.get_flight_by_code("UC0001") in view
+
+
+def test_flight_code() -> None:
+    """
+    A flight's code is its airline code followed by its flight number,
+    padded to four digits, and flights are sorted by that code
+    """
+    airports = sample_schedule_1()
+    ord = airports["ORD"]  # pylint: disable=redefined-builtin
+    lga = airports["LGA"]
+
+    flights = [Flight(ord, lga, "UC", 1000, TimeOfDay.MORNING, 100),
+               Flight(ord, lga, "UC", 42, TimeOfDay.MORNING, 100),
+               Flight(ord, lga, "UC", 7, TimeOfDay.MORNING, 100),
+               Flight(ord, lga, "AA", 999, TimeOfDay.MORNING, 100)]
+
+    for flight in flights:
+        expected = f"{flight.airline}{flight.flight_num:04}"
+        assert flight.code == expected
+        assert str(flight) == f"{expected}: ORD -> LGA @ MORNING"
+
+    assert [f.code for f in sorted(flights)] == \
+        ["AA0999", "UC0007", "UC0042", "UC1000"]
+
+
+def test_generated_schedule_same_seed() -> None:
+    """
+    Generating a schedule twice with the same seed produces
+    the same schedule
+    """
+    schedule1 = generated_schedule(50, 5, seed=42)
+    schedule2 = generated_schedule(50, 5, seed=42)
+
+    assert schedule1.keys() == schedule2.keys()
+
+    for code, airport1 in schedule1.items():
+        flights1 = sorted(airport1.flights)
+        flights2 = sorted(schedule2[code].flights)
+
+        assert [str(f) for f in flights1] == [str(f) for f in flights2]
+        assert [f.cost for f in flights1] == [f.cost for f in flights2]
+
+
+def test_generated_schedule_flight_codes() -> None:
+    """
+    Every generated flight code is two letters followed by four digits,
+    including in schedules large enough to use several airline codes
+    """
+    schedule = generated_schedule(500, 600)
+
+    num_flights = 0
+    for airport in schedule.values():
+        for flight in airport.flights_view:
+            assert re.fullmatch(r"[A-Z]{2}\d{4}", flight.code), \
+                f"Invalid flight code: {flight.code}"
+            num_flights += 1
+
+    assert num_flights == 500 * 600
+
+
+def test_write_schedule(tmp_path: Path) -> None:
+    """
+    Writing sample schedule 1 produces the same rows as files/sample-1.csv
+    """
+    file_path = str(tmp_path / "schedule.csv")
+    write_schedule(sample_schedule_1(), file_path)
+
+    assert read_rows(file_path) == read_rows("files/sample-1.csv")
+
+
+def test_write_generated_schedule(tmp_path: Path) -> None:
+    """
+    Writing a generated schedule produces a header plus one row per flight
+    """
+    schedule = generated_schedule(30, 4, seed=7)
+    file_path = str(tmp_path / "schedule.csv")
+    write_schedule(schedule, file_path)
+
+    rows = read_rows(file_path)
+
+    assert rows[0] == read_rows("files/sample-1.csv")[0]
+    assert len(rows) == 1 + 30 * 4
+    assert all(len(row) == 8 for row in rows)